@@ -4,16 +4,24 @@ A Python client for interacting with the Cashmere MCP API.
 """
 
 import asyncio
+import atexit
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union, get_origin
 import time
 
-from fastmcp import Client
-from fastmcp.client.auth import BearerAuth, OAuth
+from pydantic import TypeAdapter
+from pydantic_core import from_json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from cashmere_types import (
+    APIResponseError,
     Collection,
     CollectionsResponse,
     Publication,
@@ -24,11 +32,24 @@ from cashmere_types import (
 )
 
 
+if TYPE_CHECKING:
+    import argparse
+
+    from fastmcp import Client
+    from fastmcp.client.auth import BearerAuth
+
+logger = logging.getLogger(__name__)
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
     CASHMERE_API_KEY: str = ""
     CASHMERE_MCP_SERVER_URL: str = ""
+    # Maximum number of in-flight tool calls; 0 (the default) means unlimited
+    CASHMERE_MAX_CONCURRENT_CALLS: int = 0
+    # Validate tool responses against cashmere_types; disable for trusted servers
+    CASHMERE_VALIDATE_RESPONSES: bool = True
 
     model_config = SettingsConfigDict(env_file=".env.local", extra="ignore")
 
@@ -37,18 +58,30 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-def create_authenticated_client() -> Client:
+@lru_cache(maxsize=None)
+def _bearer_auth(api_key: str) -> "BearerAuth":
+    """Get the (stateless, shareable) bearer auth for an API key."""
+    from fastmcp.client.auth import BearerAuth
+
+    return BearerAuth(api_key)
+
+
+def create_authenticated_client() -> "Client":
     """Create an authenticated MCP client.
 
     Returns:
         An authenticated Client instance
     """
+    # Imported here so the CLI does not load the MCP stack until it is needed
+    from fastmcp import Client
+    from fastmcp.client.auth import OAuth
+
     client_kwargs = {
         "name": "Cashmere MCP Client",
         "transport": settings.CASHMERE_MCP_SERVER_URL,
     }
     if settings.CASHMERE_API_KEY:
-        client_kwargs["auth"] = BearerAuth(settings.CASHMERE_API_KEY)
+        client_kwargs["auth"] = _bearer_auth(settings.CASHMERE_API_KEY)
     elif "api_key" in settings.CASHMERE_MCP_SERVER_URL:
         # server allows this, no auth needed in client
         pass
@@ -120,7 +153,121 @@ def get_oauth_token_info() -> Dict[str, Any]:
     return info
 
 
-client = create_authenticated_client()
+class _Session:
+    """Connected client shared by the calls made inside a session() block.
+
+    Connects on first use and reconnects if the MCP session has dropped (e.g.
+    server redeploy or idle disconnect). Also holds the optional
+    CASHMERE_MAX_CONCURRENT_CALLS cap on in-flight tool calls.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional["Client"] = None
+        self._lock = asyncio.Lock()
+        limit = settings.CASHMERE_MAX_CONCURRENT_CALLS
+        self.call_limit = asyncio.Semaphore(limit) if limit > 0 else None
+
+    async def client(self) -> "Client":
+        """Get the connected client, connecting or reconnecting as needed."""
+        if self._client is None or not self._client.is_connected():
+            async with self._lock:
+                if self._client is None or not self._client.is_connected():
+                    await self.aclose()
+                    client = create_authenticated_client()
+                    await client.__aenter__()
+                    self._client = client
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the MCP session, if one is open."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        # A dropped session may fail to close cleanly; it is discarded either way
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
+# Session of the innermost session() block; tasks started inside the block
+# (e.g. by asyncio.gather) inherit it with their context
+_active_session: ContextVar[Optional[_Session]] = ContextVar("cashmere_session", default=None)
+
+
+@asynccontextmanager
+async def session() -> AsyncIterator[None]:
+    """Share one connected MCP client across the async calls made inside the block.
+
+    Without an active session, each call connects and disconnects its own
+    client. The session is closed when the block exits; nested blocks reuse
+    the outer session.
+
+    Example:
+        async with cashmere_client.session():
+            await asyncio.gather(*(async_search_publications(q) for q in queries))
+    """
+    if _active_session.get() is not None:
+        yield
+        return
+    shared = _Session()
+    token = _active_session.set(shared)
+    try:
+        yield
+    finally:
+        _active_session.reset(token)
+        await shared.aclose()
+
+
+@asynccontextmanager
+async def _client() -> AsyncIterator["Client"]:
+    """Yield the active session's client, or a client connected for this call only."""
+    shared = _active_session.get()
+    if shared is not None:
+        yield await shared.client()
+        return
+    async with create_authenticated_client() as client:
+        yield client
+
+
+# Names of the tools whose output schema carries the x-fastmcp-wrap-result
+# marker, i.e. whose non-object results the server wraps as {"result": ...}.
+# Tool schemas are fixed per server, so this is read from list_tools once.
+_wrapped_result_tools: Optional[frozenset] = None
+
+
+async def _wraps_result(client: "Client", name: str) -> bool:
+    """Whether the tool's output schema marks its structured content as wrapped."""
+    global _wrapped_result_tools
+    if _wrapped_result_tools is None:
+        _wrapped_result_tools = frozenset(
+            tool.name
+            for tool in await client.list_tools()
+            if (getattr(tool, 'outputSchema', None) or {}).get('x-fastmcp-wrap-result')
+        )
+    return name in _wrapped_result_tools
+
+
+async def _call_tool(name: str, params: Dict[str, Any]) -> Any:
+    """Call a tool, on the session's client and within its call cap when one is active.
+
+    Structured content of tools whose schema wraps the result is unwrapped in
+    place, so decoding never has to guess from the payload's shape.
+    """
+    shared = _active_session.get()
+    call_limit = shared.call_limit if shared is not None else None
+    async with _client() as client:
+        if call_limit is None:
+            result = await client.call_tool(name, params)
+        else:
+            async with call_limit:
+                result = await client.call_tool(name, params)
+        structured = getattr(result, 'structured_content', None)
+        # Only payloads shaped like a wrapper need the schema lookup
+        if isinstance(structured, dict) and structured.keys() == {'result'}:
+            if await _wraps_result(client, name):
+                result.structured_content = structured['result']
+    return result
 
 
 # Mapping of tool names to their expected Pydantic model types
@@ -134,8 +281,12 @@ TOOL_TYPE_MAPPING = {
 }
 
 
+@lru_cache(maxsize=None)
 def _pydantic_to_json_schema_properties(model_class) -> dict:
-    """Convert Pydantic model to JSON schema properties for comparison."""
+    """Convert Pydantic model to JSON schema properties for comparison.
+
+    The schema is generated once per model; callers must not mutate the result.
+    """
     if hasattr(model_class, 'model_json_schema'):
         schema = model_class.model_json_schema()
         return schema.get('properties', {})
@@ -230,44 +381,114 @@ def _validate_tool_schema_against_type(tool_name: str, tool_schema: dict) -> dic
     return result
 
 
-def _parse_and_validate(result: Any, model_type: type) -> Any:
-    """Parse JSON content and validate with Pydantic model."""
-    def _extract_json_data(obj: Any) -> Any:
-        """Extract JSON data from various MCP response formats, handling CallToolResult objects."""
-        # CallToolResult object (from fastmcp) - has content but no text
-        if hasattr(obj, 'content') and not hasattr(obj, 'text'):
-            if isinstance(obj.content, list) and len(obj.content) > 0:
-                # Extract from all items, return single if only one
-                extracted = [_extract_json_data(item) for item in obj.content]
-                return extracted[0] if len(extracted) == 1 else extracted
-            return obj.content
-        # TextContent object or item with text attribute
-        elif hasattr(obj, 'text'):
-            return json.loads(obj.text)
-        # List with single TextContent
-        elif isinstance(obj, list) and len(obj) == 1 and hasattr(obj[0], 'text'):
-            return json.loads(obj[0].text)
-        # Raw string/bytes
-        elif isinstance(obj, (str, bytes, bytearray)):
-            return json.loads(obj)
-        # Already parsed JSON or other data structures - clean recursively
-        elif isinstance(obj, list):
-            return [_extract_json_data(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: _extract_json_data(v) for k, v in obj.items()}
-        else:
-            return obj
+@lru_cache(maxsize=None)
+def _type_adapter(model_type: Any) -> Tuple[TypeAdapter, bool]:
+    """Build (once per type) the validator for a response type.
 
-    data = _extract_json_data(result)
+    Returns:
+        The TypeAdapter and whether the type is a list type
+    """
+    return TypeAdapter(model_type), get_origin(model_type) is list
 
-    # Validate with Pydantic
-    if hasattr(model_type, '__origin__') and model_type.__origin__ is list:
-        if not isinstance(data, list):
+
+def _raw_json_text(result: Any) -> Optional[str]:
+    """Get the JSON text of a tool result carrying a single TextContent and no structured content."""
+    if getattr(result, 'structured_content', None) is not None:
+        return None
+    content = getattr(result, 'content', None)
+    if isinstance(content, list) and len(content) == 1:
+        text = getattr(content[0], 'text', None)
+        if isinstance(text, str):
+            return text
+    return None
+
+
+# Maximum number of characters of a response quoted in error messages
+_ERROR_RESPONSE_CHARS = 512
+
+
+def _response_text(result: Any) -> str:
+    """Render the start of a tool result as text for error messages."""
+    content = getattr(result, 'content', result)
+    items = content if isinstance(content, list) else [content]
+    parts = []
+    for item in items:
+        item = getattr(item, 'text', item)
+        if isinstance(item, (bytes, bytearray)):
+            # Only decode the slice that will be shown
+            item = bytes(item[:_ERROR_RESPONSE_CHARS]).decode('utf-8', errors='replace')
+        parts.append(str(item)[:_ERROR_RESPONSE_CHARS])
+    return "\n".join(parts)[:_ERROR_RESPONSE_CHARS]
+
+
+def _decode_json(obj: Any) -> Any:
+    """Decode JSON data from various MCP response formats, handling CallToolResult objects.
+
+    This does no validation; typed callers go through _parse_and_validate.
+    """
+    # Already parsed JSON object
+    if type(obj) is dict:
+        return obj
+    # Raw string/bytes
+    if isinstance(obj, (str, bytes, bytearray)):
+        return from_json(obj)
+    # TextContent object or item with text attribute
+    text = getattr(obj, 'text', None)
+    if text is not None:
+        return from_json(text)
+    # Structured content was already decoded with the JSON-RPC message, so
+    # prefer it over parsing the serialized copy in the text content again.
+    # (_call_tool has already unwrapped results the tool schema marks as wrapped)
+    structured = getattr(obj, 'structured_content', None)
+    if structured is not None:
+        return structured
+    # CallToolResult object (from fastmcp) - has content but no text
+    content = getattr(obj, 'content', None)
+    if content is not None:
+        if isinstance(content, list) and len(content) > 0:
+            return _decode_items(content)
+        return content
+    # List of TextContent
+    if isinstance(obj, list) and obj and hasattr(obj[0], 'text'):
+        return _decode_items(obj)
+    # Already parsed JSON array or other data structures
+    return obj
+
+
+def _decode_items(items: list) -> Any:
+    """Decode data from content items, returning a single item unwrapped."""
+    if len(items) == 1:
+        return _decode_json(items[0])
+    return [_decode_json(item) for item in items]
+
+
+def _parse_and_validate(result: Any, model_type: type) -> Any:
+    """Parse JSON content and validate with Pydantic model."""
+    adapter, is_list = _type_adapter(model_type)
+
+    try:
+        # Single JSON text payload: let the validator parse it directly, without
+        # materializing an intermediate Python object first
+        if settings.CASHMERE_VALIDATE_RESPONSES:
+            text = _raw_json_text(result)
+            # Peek at the start rather than lstrip() the whole payload into a copy
+            if text is not None and (not is_list or text[:64].lstrip().startswith('[')):
+                return adapter.dump_python(adapter.validate_json(text))
+
+        data = _decode_json(result)
+        if is_list and not isinstance(data, list):
             data = [data]
-        item_type = model_type.__args__[0]
-        return [item_type.model_validate(item).model_dump() for item in data]
-    else:
-        return model_type.model_validate(data).model_dump()
+        # Trusted server: the decoded payload is already in the response shape
+        if not settings.CASHMERE_VALIDATE_RESPONSES:
+            return data
+
+        # Validate with Pydantic
+        return adapter.dump_python(adapter.validate_python(data))
+    except ValueError as e:
+        # Only render the raw response once we know it is needed for the error
+        raise APIResponseError(
+            f"Unexpected response for {model_type}: {e}\nResponse: {_response_text(result)}"
+        ) from e
 
 
 # Async functions
@@ -277,24 +498,26 @@ async def async_list_tools() -> list[dict]:
     Returns:
         List[dict]: List of available tools as dictionaries, including inputSchema (parameters)
     """
-    async with client:
+    async with _client() as client:
         result = await client.list_tools()
-        # Return tools as dictionaries to avoid validation issues
-        tools = []
-        for tool in result:
-            tool_dict = tool.model_dump()
-            if hasattr(tool, 'inputSchema') and 'inputSchema' not in tool_dict:
-                tool_dict['inputSchema'] = tool.inputSchema
-            tools.append(tool_dict)
-        return tools
+    # Return tools as dictionaries to avoid validation issues
+    tools = []
+    for tool in result:
+        tool_dict = tool.model_dump()
+        if hasattr(tool, 'inputSchema') and 'inputSchema' not in tool_dict:
+            tool_dict['inputSchema'] = tool.inputSchema
+        tools.append(tool_dict)
+    return tools
 
 
 async def async_list_tools_with_key(api_key: str) -> list[dict]:
-    """List tools using a specific API key (bypasses module-level client)."""
+    """List tools using a specific API key (bypasses the shared client)."""
+    from fastmcp import Client
+
     temp_client = Client(
         name="Cashmere MCP Client",
         transport=settings.CASHMERE_MCP_SERVER_URL,
-        auth=BearerAuth(api_key),
+        auth=_bearer_auth(api_key),
     )
     async with temp_client:
         result = await temp_client.list_tools()
@@ -313,9 +536,8 @@ async def async_list_resources():
     Returns:
         List of available resources
     """
-    async with client:
-        result = await client.list_resources()
-        return result
+    async with _client() as client:
+        return await client.list_resources()
 
 
 async def async_get_resource(uri: str) -> Any:
@@ -327,9 +549,8 @@ async def async_get_resource(uri: str) -> Any:
     Returns:
         The resource content and metadata
     """
-    async with client:
-        result = await client.read_resource(uri)
-        return result
+    async with _client() as client:
+        return await client.read_resource(uri)
 
 
 async def async_search_publications(
@@ -358,14 +579,12 @@ async def async_search_publications(
         else:
             params["external_ids"] = external_ids
 
-    async with client:
-        start = time.time()
-        result = await client.call_tool("search_publications", params)
-        # print(f"Result: {result}")
-        # Parse the result as a list of SearchPublicationItem
-        print("[search_publications]", time.time() - start)
-        parsed = _parse_and_validate(result, SearchPublicationsResponse)
-        return parsed
+    start = time.time()
+    result = await _call_tool("search_publications", params)
+    logger.debug("[search_publications] %.3fs", time.time() - start)
+    # Parse the result as a list of SearchPublicationItem
+    parsed = _parse_and_validate(result, SearchPublicationsResponse)
+    return parsed
 
 
 async def async_list_publications(
@@ -386,23 +605,21 @@ async def async_list_publications(
     Raises:
         APIResponseError: If the API response format is unexpected
     """
-    async with client:
-        params: Dict[str, Any] = {}
-        if collection_id is not None:
-            params["collection_id"] = collection_id
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
+    params: Dict[str, Any] = {}
+    if collection_id is not None:
+        params["collection_id"] = collection_id
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
 
-        start = time.time()
-        result = await client.call_tool("list_publications", params)
-        # Parse the result and ensure it's in the correct PublicationsResponse format
-        parsed = _parse_and_validate(result, PublicationsResponse)
-        end = time.time()
-        print("[list publications]", end - start)
+    start = time.time()
+    result = await _call_tool("list_publications", params)
+    # Parse the result and ensure it's in the correct PublicationsResponse format
+    parsed = _parse_and_validate(result, PublicationsResponse)
+    logger.debug("[list_publications] %.3fs", time.time() - start)
 
-        return parsed
+    return parsed
 
 
 async def async_get_publication(publication_id: str) -> dict:
@@ -417,10 +634,32 @@ async def async_get_publication(publication_id: str) -> dict:
     Raises:
         APIResponseError: If the API response format is unexpected
     """
-    async with client:
-        result = await client.call_tool("get_publication", {"publication_id": publication_id})
-        parsed = _parse_and_validate(result, Publication)
-        return parsed
+    result = await _call_tool("get_publication", {"publication_id": publication_id})
+    parsed = _parse_and_validate(result, Publication)
+    return parsed
+
+
+async def async_get_publications(publication_ids: List[str]) -> List[dict]:
+    """Get several publications by ID concurrently over the shared client.
+
+    Args:
+        publication_ids: The IDs of the publications to retrieve
+
+    Returns:
+        The requested publications, in the same order as the IDs
+
+    Raises:
+        APIResponseError: If the API response format is unexpected
+    """
+    tasks = [asyncio.ensure_future(async_get_publication(i)) for i in publication_ids]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Do not leave the other lookups running unowned after one fails
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def async_list_collections(
@@ -439,16 +678,15 @@ async def async_list_collections(
     Raises:
         APIResponseError: If the API response format is unexpected
     """
-    async with client:
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        start = time.time()
-        result = await client.call_tool("list_collections", params)
-        print("[list_collections]", time.time() - start)
-        return _parse_and_validate(result, CollectionsResponse)
+    params: Dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    start = time.time()
+    result = await _call_tool("list_collections", params)
+    logger.debug("[list_collections] %.3fs", time.time() - start)
+    return _parse_and_validate(result, CollectionsResponse)
 
 
 async def async_get_collection(collection_id: int) -> dict:
@@ -464,9 +702,8 @@ async def async_get_collection(collection_id: int) -> dict:
         APIResponseError: If the API response format is unexpected
         ValueError: If the collection is not found
     """
-    async with client:
-        result = await client.call_tool("get_collection", {"collection_id": collection_id})
-        return _parse_and_validate(result, Collection)
+    result = await _call_tool("get_collection", {"collection_id": collection_id})
+    return _parse_and_validate(result, Collection)
 
 
 async def async_get_usage_report_summary(
@@ -481,37 +718,122 @@ async def async_get_usage_report_summary(
     Returns:
         Usage report summary
     """
-    async with client:
-        params = {}
-        if external_ids:
-            params["external_ids"] = external_ids if isinstance(external_ids, list) else [external_ids]
-        result = await client.call_tool("get_usage_report_summary", params or {})
-        return _parse_and_validate(result, UsageReportSummary)
+    params = {}
+    if external_ids:
+        params["external_ids"] = external_ids if isinstance(external_ids, list) else [external_ids]
+    result = await _call_tool("get_usage_report_summary", params or {})
+    return _parse_and_validate(result, UsageReportSummary)
+
+
+def run_async(coro: Any) -> Any:
+    """Run a top-level coroutine on uvloop when it is installed, else with asyncio.run."""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    # Run outside the except block so errors raised by the coroutine are not
+    # chained to the ImportError
+    if uvloop is None:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 # Synchronous wrappers for backward compatibility
+# Event loop shared by the synchronous wrappers, run on a background thread so
+# wrappers can be called from any thread (including concurrently), and the
+# session it owns, so consecutive calls reuse one connected client. Both are
+# closed at exit, and forgotten in forked children, which do not inherit the
+# loop's thread.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_session: Optional[_Session] = None
+_sync_thread: Optional[threading.Thread] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> Tuple[asyncio.AbstractEventLoop, _Session]:
+    """Get the synchronous wrappers' event loop and session, starting the loop's thread on first use."""
+    global _sync_loop, _sync_session, _sync_thread
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            _sync_session = _Session()
+            _sync_thread = threading.Thread(
+                target=_sync_loop.run_forever,
+                name="cashmere-client-loop",
+                daemon=True,
+            )
+            _sync_thread.start()
+        return _sync_loop, _sync_session
+
+
+def _forget_sync_loop() -> None:
+    """Drop the parent's loop and session in a forked child so it starts its own on first use."""
+    global _sync_loop, _sync_session, _sync_thread, _sync_loop_lock
+    _sync_loop = _sync_session = _sync_thread = None
+    _sync_loop_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_sync_loop)
+
+
+async def _in_session(shared: _Session, coro: Any) -> Any:
+    _active_session.set(shared)
+    return await coro
+
+
+def _run(coro: Any) -> Any:
+    """Run a coroutine in the synchronous wrappers' session and wait for its result.
+
+    Raises:
+        RuntimeError: If called from the wrappers' own loop thread, where
+            waiting for the result would deadlock.
+    """
+    if threading.current_thread() is _sync_thread:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous cashmere_client functions cannot be called from its event loop; await the async_* variants instead."
+        )
+    loop, shared = _get_sync_loop()
+    return asyncio.run_coroutine_threadsafe(_in_session(shared, coro), loop).result()
+
+
+@atexit.register
+def _close_sync_loop() -> None:
+    """Close the synchronous wrappers' session and stop their event loop at exit."""
+    loop, shared = _sync_loop, _sync_session
+    if loop is None or shared is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(shared.aclose(), loop).result(timeout=5)
+    except Exception:
+        pass
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
 def list_tools() -> list[dict]:
     """Synchronously list all available tools.
 
     Returns:
         List[dict]: List of available tools as dictionaries
     """
-    return asyncio.run(async_list_tools())
+    return _run(async_list_tools())
 
 
 def list_tools_with_key(api_key: str) -> list[dict]:
-    """Synchronously list tools using a specific API key (bypasses module-level client)."""
-    return asyncio.run(async_list_tools_with_key(api_key))
+    """Synchronously list tools using a specific API key (bypasses the shared client)."""
+    return _run(async_list_tools_with_key(api_key))
 
 
 def list_resources():
     """Synchronously list all available resources."""
-    return asyncio.run(async_list_resources())
+    return _run(async_list_resources())
 
 
 def get_resource(uri: str) -> Any:
     """Synchronously get a specific resource by URI."""
-    return asyncio.run(async_get_resource(uri))
+    return _run(async_get_resource(uri))
 
 
 def search_publications(
@@ -519,7 +841,7 @@ def search_publications(
     external_ids: Optional[Union[str, List[str]]] = None
 ) -> List[dict]:
     """Synchronously search for publications."""
-    return asyncio.run(async_search_publications(query, external_ids))
+    return _run(async_search_publications(query, external_ids))
 
 
 def list_publications(
@@ -537,12 +859,17 @@ def list_publications(
     Returns:
         Publications response containing items and count
     """
-    return asyncio.run(async_list_publications(collection_id, limit, offset))
+    return _run(async_list_publications(collection_id, limit, offset))
 
 
 def get_publication(publication_id: str) -> dict:
     """Synchronously get a single publication."""
-    return asyncio.run(async_get_publication(publication_id))
+    return _run(async_get_publication(publication_id))
+
+
+def get_publications(publication_ids: List[str]) -> List[dict]:
+    """Synchronously get several publications concurrently."""
+    return _run(async_get_publications(publication_ids))
 
 
 def list_collections(
@@ -550,18 +877,18 @@ def list_collections(
     offset: Optional[int] = None,
 ) -> dict:
     """Synchronously list all collections."""
-    return asyncio.run(async_list_collections(limit, offset))
+    return _run(async_list_collections(limit, offset))
 
 
 def get_collection(collection_id: int) -> dict:
     """Synchronously get a single collection."""
-    return asyncio.run(async_get_collection(collection_id))
+    return _run(async_get_collection(collection_id))
 
 def get_usage_report_summary(
     external_ids: Optional[Union[str, List[str]]] = None
 ) -> Dict[str, Any]:
     """
-    Synchronously get usage report summary. If called from a running event loop, raises RuntimeError.
+    Synchronously get usage report summary.
 
     Args:
         external_ids: Optional external IDs to filter by
@@ -569,11 +896,256 @@ def get_usage_report_summary(
     Returns:
         Usage report summary
     """
-    return asyncio.run(async_get_usage_report_summary(external_ids=external_ids))
+    return _run(async_get_usage_report_summary(external_ids=external_ids))
 
 # Command-line interface
-def main() -> None:
-    """Main entry point for command-line usage."""
+def _cmd_list_tools(args: "argparse.Namespace") -> None:
+    """Print the available tools with their parameters and output schemas."""
+    tools = list_tools()
+    print(f"{len(tools)} available tools:")
+    for tool in tools:
+        print(f"- {tool['name']}")
+        print(f"  Description: {tool['description']}")
+        # Show input schema (parameters)
+        if 'inputSchema' in tool and tool['inputSchema']:
+            input_schema = tool['inputSchema']
+            print(f"  Input Parameters:")
+            if 'properties' in input_schema:
+                for param_name, param_info in input_schema['properties'].items():
+                    param_type = param_info.get('type', 'unknown')
+                    param_desc = param_info.get('description', '')
+                    required = param_name in input_schema.get('required', [])
+                    required_str = " (required)" if required else " (optional)"
+                    print(f"    - {param_name}: {param_type}{required_str}")
+                    if param_desc:
+                        print(f"        {param_desc}")
+            elif 'type' in input_schema:
+                print(f"    Type: {input_schema['type']}")
+        else:
+            print(f"  Input Parameters: None")
+        # Check if tool has output schema
+        if 'outputSchema' in tool and tool['outputSchema']:
+            schema = tool['outputSchema']
+            print(f"  Has Output Schema: Yes")
+            print(f"  Schema Type: {schema.get('type', 'unknown')}")
+            if 'properties' in schema:
+                print(f"  Schema Properties: {list(schema['properties'].keys())}")
+        else:
+            print(f"  Has Output Schema: No")
+        print()
+
+
+def _cmd_check_schemas(args: "argparse.Namespace") -> None:
+    """Check tool output schemas against the expected cashmere_types models."""
+    tools = list_tools()
+    print("Output Schema Analysis & Type Validation:")
+    print("=" * 60)
+
+    tools_with_schema = []
+    tools_without_schema = []
+    validation_results = {}
+
+    for tool in tools:
+        if 'outputSchema' in tool and tool['outputSchema']:
+            tools_with_schema.append(tool)
+            # Validate against expected Pydantic types
+            validation_results[tool['name']] = _validate_tool_schema_against_type(
+                tool['name'], tool['outputSchema']
+            )
+        else:
+            tools_without_schema.append(tool)
+
+    print(f"Tools WITH output schemas ({len(tools_with_schema)}):")
+    valid_count = 0
+    for tool in tools_with_schema:
+        schema = tool['outputSchema']
+        validation = validation_results[tool['name']]
+
+        # Status indicator
+        if validation['valid']:
+            status = "✓ VALID"
+            valid_count += 1
+        else:
+            status = "⚠ INVALID"
+
+        print(f"  {status} {tool['name']}")
+        print(f"    Schema Type: {schema.get('type', 'unknown')}")
+
+        if validation['expected_type']:
+            print(f"    Expected Type: {validation['expected_type']}")
+
+        if 'properties' in schema:
+            print(f"    Properties: {', '.join(schema['properties'].keys())}")
+
+        if validation['issues']:
+            print(f"    Issues:")
+            for issue in validation['issues']:
+                print(f"      - {issue}")
+
+        print()
+
+    print(f"Tools WITHOUT output schemas ({len(tools_without_schema)}):")
+    for tool in tools_without_schema:
+        print(f"  ✗ {tool['name']}")
+
+    print(f"\nSummary:")
+    print(f"  - {len(tools_with_schema)}/{len(tools)} tools have output schemas")
+    print(f"  - {valid_count}/{len(tools_with_schema)} schemas are valid against expected types")
+
+    # Show tools without defined types
+    tools_without_types = [name for name in [t['name'] for t in tools_with_schema]
+                          if name not in TOOL_TYPE_MAPPING]
+    if tools_without_types:
+        print(f"  - Tools without defined types in cashmere_types.py: {', '.join(tools_without_types)}")
+
+
+def _cmd_list_resources(args: "argparse.Namespace") -> None:
+    """Print the available resources."""
+    resources = list_resources()
+    print(f"{len(resources)} available resources:")
+    for resource in resources:
+        # Use attribute access for Resource objects
+        name = getattr(resource, 'name', 'Unnamed')
+        print(f"- {name}")
+
+
+def _resource_to_dict(resource: Any) -> Any:
+    """Normalize a resource response into JSON-serializable dicts.
+
+    Handles Pydantic models, dicts, lists of either, and plain objects such as
+    TextResourceContents, whose public non-callable attributes are extracted.
+    """
+    if hasattr(resource, 'model_dump'):
+        return resource.model_dump()
+    if isinstance(resource, dict):
+        return resource
+    if isinstance(resource, list):
+        return [_resource_to_dict(item) for item in resource]
+    resource_dict = {}
+    for attr in dir(resource):
+        if not attr.startswith('_'):
+            try:
+                value = getattr(resource, attr)
+            except Exception:
+                continue
+            if not callable(value):
+                resource_dict[attr] = value
+    # If we couldn't extract anything, fall back to string representation
+    return resource_dict or {"raw": str(resource)}
+
+
+def _cmd_get_resource(args: "argparse.Namespace") -> None:
+    """Print a resource and all of its metadata as JSON."""
+    resource = get_resource(args.uri)
+    print(json.dumps(_resource_to_dict(resource), indent=2, default=str))
+
+
+def _cmd_search(args: "argparse.Namespace") -> None:
+    """Search publications and print the results."""
+    start = time.time()
+    results = search_publications(args.query, args.external_ids)
+    end = time.time()
+    print("time", end - start)
+    print(f"Found {len(results)} results:")
+    for i, result in enumerate(results, 1):
+        print(f"{i}. {result.get('omnipub_title', 'Untitled')} - {result.get('content', '')[:50]}...")
+        print(result)
+
+
+def _cmd_list_publications(args: "argparse.Namespace") -> None:
+    """Print a page of publications."""
+    response = list_publications(
+        collection_id=args.collection_id,
+        limit=args.limit,
+        offset=args.offset
+    )
+    print(f"Found {response.get('count', 0)} publications:")
+    for pub_item in response.get('items', []):
+        pub_data = pub_item.get('data', {})
+        print(f"- {pub_data.get('title', 'Untitled')} ({pub_item.get('uuid', 'No ID')})")
+
+
+def _cmd_get_publication(args: "argparse.Namespace") -> None:
+    """Print the title and ID of each requested publication."""
+    for pub in get_publications(args.publication_ids):
+        print(f"Title: {pub.get('data', {}).get('title', 'Untitled')}")
+        print(f"ID: {pub.get('uuid', 'No ID')}")
+
+
+def _cmd_list_collections(args: "argparse.Namespace") -> None:
+    """Print a page of collections."""
+    collections = list_collections(limit=args.limit, offset=args.offset)
+    print(f"Found {collections['count']} collections:")
+    for coll in collections['items']:
+        print(f"- {coll.get('name', 'Unnamed collection')} (ID: {coll.get('id', '?')})")
+
+
+def _cmd_get_collection(args: "argparse.Namespace") -> None:
+    """Print a single collection."""
+    coll = get_collection(args.collection_id)
+    print(f"Name: {coll.get('name', 'Unnamed collection')}")
+    print(f"ID: {coll.get('id', '?')}")
+    print(f"Description: {coll.get('description', 'No description')}")
+
+
+def _cmd_usage(args: "argparse.Namespace") -> None:
+    """Print the usage report summary."""
+    usage = get_usage_report_summary(external_ids=args.external_ids)
+    print(usage)
+
+
+def _cmd_oauth_token_info(args: "argparse.Namespace") -> None:
+    """Print information about the locally saved OAuth token."""
+    info = get_oauth_token_info()
+    if not info["found"]:
+        print("No OAuth token found locally.")
+        print("Token may not yet be created. Check ~/.fastmcp/oauth-mcp-client-cache/ manually.")
+        return
+    print("OAuth token found:")
+    print(f"  Location: {info['location']}")
+    print(f"  Size: {info['size']} bytes")
+    if "keys" in info:
+        print(f"  Token keys: {', '.join(info['keys'])}")
+    if "expires_at" in info:
+        print(f"  Expires at: {info['expires_at']}")
+    if "access_token_preview" in info:
+        print(f"  Access token: {info['access_token_preview']}...")
+
+
+def _cmd_reset_oauth_token(args: "argparse.Namespace") -> None:
+    """Delete the locally saved OAuth token."""
+    if reset_oauth_token():
+        print("OAuth token successfully reset/deleted.")
+        print("You will need to re-authenticate on the next client usage.")
+    else:
+        print("No OAuth token found to reset.")
+        print("Token may be stored in a different location or not yet created.")
+
+
+# Handlers for each CLI subcommand
+COMMANDS = {
+    "list-tools": _cmd_list_tools,
+    "check-schemas": _cmd_check_schemas,
+    "list-resources": _cmd_list_resources,
+    "get-resource": _cmd_get_resource,
+    "search": _cmd_search,
+    "list-publications": _cmd_list_publications,
+    "get-publication": _cmd_get_publication,
+    "list-collections": _cmd_list_collections,
+    "get-collection": _cmd_get_collection,
+    "usage": _cmd_usage,
+    "oauth-token-info": _cmd_oauth_token_info,
+    "reset-oauth-token": _cmd_reset_oauth_token,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for command-line usage.
+
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:], so the CLI can be
+            driven in-process without spawning an interpreter
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Cashmere MCP Client")
@@ -604,8 +1176,8 @@ def main() -> None:
     list_pubs_parser.add_argument("--offset", type=int, help="Pagination offset")
 
     # Get publication
-    get_pub_parser = subparsers.add_parser("get-publication", help="Get publication by ID")
-    get_pub_parser.add_argument("publication_id", help="Publication ID")
+    get_pub_parser = subparsers.add_parser("get-publication", help="Get publications by ID")
+    get_pub_parser.add_argument("publication_ids", nargs="+", help="Publication IDs")
 
     # List collections
     list_colls_parser = subparsers.add_parser("list-collections", help="List collections")
@@ -624,223 +1196,9 @@ def main() -> None:
     subparsers.add_parser("oauth-token-info", help="Get information about the locally saved OAuth token")
     subparsers.add_parser("reset-oauth-token", help="Reset/clear the locally saved OAuth token")
 
-    args = parser.parse_args()
-
-    if args.command == "list-tools":
-        tools = list_tools()
-        print(f"{len(tools)} available tools:")
-        for tool in tools:
-            print(f"- {tool['name']}")
-            print(f"  Description: {tool['description']}")
-            # Show input schema (parameters)
-            if 'inputSchema' in tool and tool['inputSchema']:
-                input_schema = tool['inputSchema']
-                print(f"  Input Parameters:")
-                if 'properties' in input_schema:
-                    for param_name, param_info in input_schema['properties'].items():
-                        param_type = param_info.get('type', 'unknown')
-                        param_desc = param_info.get('description', '')
-                        required = param_name in input_schema.get('required', [])
-                        required_str = " (required)" if required else " (optional)"
-                        print(f"    - {param_name}: {param_type}{required_str}")
-                        if param_desc:
-                            print(f"        {param_desc}")
-                elif 'type' in input_schema:
-                    print(f"    Type: {input_schema['type']}")
-            else:
-                print(f"  Input Parameters: None")
-            # Check if tool has output schema
-            if 'outputSchema' in tool and tool['outputSchema']:
-                schema = tool['outputSchema']
-                print(f"  Has Output Schema: Yes")
-                print(f"  Schema Type: {schema.get('type', 'unknown')}")
-                if 'properties' in schema:
-                    print(f"  Schema Properties: {list(schema['properties'].keys())}")
-            else:
-                print(f"  Has Output Schema: No")
-            print()
-
-    elif args.command == "check-schemas":
-        tools = list_tools()
-        print("Output Schema Analysis & Type Validation:")
-        print("=" * 60)
-
-        tools_with_schema = []
-        tools_without_schema = []
-        validation_results = {}
-
-        for tool in tools:
-            if 'outputSchema' in tool and tool['outputSchema']:
-                tools_with_schema.append(tool)
-                # Validate against expected Pydantic types
-                validation_results[tool['name']] = _validate_tool_schema_against_type(
-                    tool['name'], tool['outputSchema']
-                )
-            else:
-                tools_without_schema.append(tool)
-
-        print(f"Tools WITH output schemas ({len(tools_with_schema)}):")
-        valid_count = 0
-        for tool in tools_with_schema:
-            schema = tool['outputSchema']
-            validation = validation_results[tool['name']]
-
-            # Status indicator
-            if validation['valid']:
-                status = "✓ VALID"
-                valid_count += 1
-            else:
-                status = "⚠ INVALID"
-
-            print(f"  {status} {tool['name']}")
-            print(f"    Schema Type: {schema.get('type', 'unknown')}")
-
-            if validation['expected_type']:
-                print(f"    Expected Type: {validation['expected_type']}")
+    args = parser.parse_args(argv)
+    COMMANDS[args.command](args)
 
-            if 'properties' in schema:
-                print(f"    Properties: {', '.join(schema['properties'].keys())}")
-
-            if validation['issues']:
-                print(f"    Issues:")
-                for issue in validation['issues']:
-                    print(f"      - {issue}")
-
-            print()
-
-        print(f"Tools WITHOUT output schemas ({len(tools_without_schema)}):")
-        for tool in tools_without_schema:
-            print(f"  ✗ {tool['name']}")
-
-        print(f"\nSummary:")
-        print(f"  - {len(tools_with_schema)}/{len(tools)} tools have output schemas")
-        print(f"  - {valid_count}/{len(tools_with_schema)} schemas are valid against expected types")
-
-        # Show tools without defined types
-        tools_without_types = [name for name in [t['name'] for t in tools_with_schema]
-                              if name not in TOOL_TYPE_MAPPING]
-        if tools_without_types:
-            print(f"  - Tools without defined types in cashmere_types.py: {', '.join(tools_without_types)}")
-
-    elif args.command == "list-resources":
-        resources = list_resources()
-        print(f"{len(resources)} available resources:")
-        for resource in resources:
-            # Use attribute access for Resource objects
-            name = getattr(resource, 'name', 'Unnamed')
-            print(f"- {name}")
-
-    elif args.command == "get-resource":
-        resource = get_resource(args.uri)
-        # Print all metadata from the resource
-        # Handle different response formats (dict, Pydantic model, object with attributes, etc.)
-        if hasattr(resource, 'model_dump'):
-            # Pydantic model
-            resource_dict = resource.model_dump()
-        elif isinstance(resource, dict):
-            # Already a dict
-            resource_dict = resource
-        elif isinstance(resource, list):
-            # Handle list of resources
-            resource_dict = []
-            for item in resource:
-                if hasattr(item, 'model_dump'):
-                    resource_dict.append(item.model_dump())
-                elif isinstance(item, dict):
-                    resource_dict.append(item)
-                else:
-                    # Extract attributes from object
-                    item_dict = {}
-                    for attr in dir(item):
-                        if not attr.startswith('_'):
-                            try:
-                                value = getattr(item, attr)
-                                if not callable(value):
-                                    item_dict[attr] = value
-                            except:
-                                pass
-                    resource_dict.append(item_dict if item_dict else {"raw": str(item)})
-        else:
-            # Extract attributes from object (handles TextResourceContents, etc.)
-            resource_dict = {}
-            for attr in dir(resource):
-                if not attr.startswith('_'):
-                    try:
-                        value = getattr(resource, attr)
-                        if not callable(value):
-                            resource_dict[attr] = value
-                    except:
-                        pass
-            # If we couldn't extract anything, fall back to string representation
-            if not resource_dict:
-                resource_dict = {"raw": str(resource)}
-        print(json.dumps(resource_dict, indent=2, default=str))
-
-    elif args.command == "search":
-        start = time.time()
-        results = search_publications(args.query, args.external_ids)
-        end = time.time()
-        print("time", end - start)
-        print(f"Found {len(results)} results:")
-        for i, result in enumerate(results, 1):
-            print(f"{i}. {result.get('omnipub_title', 'Untitled')} - {result.get('content', '')[:50]}...")
-            print(result)
-
-    elif args.command == "list-publications":
-        response = list_publications(
-            collection_id=args.collection_id,
-            limit=args.limit,
-            offset=args.offset
-        )
-        print(f"Found {response.get('count', 0)} publications:")
-        for pub_item in response.get('items', []):
-            pub_data = pub_item.get('data', {})
-            print(f"- {pub_data.get('title', 'Untitled')} ({pub_item.get('uuid', 'No ID')})")
-
-    elif args.command == "get-publication":
-        pub = get_publication(args.publication_id)
-        print(f"Title: {pub.get('data', {}).get('title', 'Untitled')}")
-        print(f"ID: {pub.get('uuid', 'No ID')}")
-
-    elif args.command == "list-collections":
-        collections = list_collections(limit=args.limit, offset=args.offset)
-        print(f"Found {collections['count']} collections:")
-        for coll in collections['items']:
-            print(f"- {coll.get('name', 'Unnamed collection')} (ID: {coll.get('id', '?')})")
-
-    elif args.command == "get-collection":
-        coll = get_collection(args.collection_id)
-        print(f"Name: {coll.get('name', 'Unnamed collection')}")
-        print(f"ID: {coll.get('id', '?')}")
-        print(f"Description: {coll.get('description', 'No description')}")
-
-    elif args.command == "usage":
-        usage = get_usage_report_summary(external_ids=args.external_ids)
-        print(usage)
-
-    elif args.command == "oauth-token-info":
-        info = get_oauth_token_info()
-        if not info["found"]:
-            print("No OAuth token found locally.")
-            print("Token may not yet be created. Check ~/.fastmcp/oauth-mcp-client-cache/ manually.")
-            return
-        print("OAuth token found:")
-        print(f"  Location: {info['location']}")
-        print(f"  Size: {info['size']} bytes")
-        if "keys" in info:
-            print(f"  Token keys: {', '.join(info['keys'])}")
-        if "expires_at" in info:
-            print(f"  Expires at: {info['expires_at']}")
-        if "access_token_preview" in info:
-            print(f"  Access token: {info['access_token_preview']}...")
-
-    elif args.command == "reset-oauth-token":
-        if reset_oauth_token():
-            print("OAuth token successfully reset/deleted.")
-            print("You will need to re-authenticate on the next client usage.")
-        else:
-            print("No OAuth token found to reset.")
-            print("Token may be stored in a different location or not yet created.")
 
 if __name__ == "__main__":
     main()
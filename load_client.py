@@ -1,18 +1,289 @@
 import asyncio
+from collections import Counter
+from contextlib import contextmanager
+import cProfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+import itertools
 import json
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import math
+import pstats
+import queue
 import random
 import sys
 import time
+from typing import TYPE_CHECKING
 
-from cashmere_client import async_search_publications
+from cashmere_client import async_search_publications, run_async, session, settings
 
+if TYPE_CHECKING:
+    import argparse
+
+
+# HTTP requests per client call: the MCP session (and its connection pool) is
+# shared across calls, so each call is a single tool request
+REQUESTS_PER_CALL = 1
+
+logger = logging.getLogger(__name__)
+
+# Exponential backoff caps before each retry: 100ms, 200ms, 400ms, etc.
+BACKOFFS = tuple(0.1 * (1 << i) for i in range(8))
+
+# Monotonic high-resolution clock for request latencies, bound once
+_perf = time.perf_counter
+
+
+# Relative width of latency histogram buckets (1% precision)
+_BUCKET_GROWTH = 1.01
+_LOG_BUCKET_GROWTH = math.log(_BUCKET_GROWTH)
+
+# Percentiles shown in latency summaries, out into the far tail
+REPORT_PERCENTILES = (50, 75, 90, 95, 99, 99.9, 99.99)
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets, in the spirit of HdrHistogram.
+
+    Samples are counted in buckets 1% wide (from 1 microsecond up), so memory
+    stays constant however long the test runs and percentiles are accurate to
+    about 1%.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, seconds: float) -> None:
+        """Record a latency sample in seconds."""
+        micros = max(seconds * 1e6, 1.0)
+        self.counts[int(math.log(micros) / _LOG_BUCKET_GROWTH)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Latency in seconds at or below which pct percent of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                # Report the bucket's upper edge, never beyond the observed max
+                return min(_BUCKET_GROWTH ** (bucket + 1) / 1e6, self.max)
+        return self.max
+
+    def distribution(self) -> list[tuple[float, float]]:
+        """(percentile, latency seconds) pairs from REPORT_PERCENTILES.
+
+        A percentile is only included once at least one sample lies above
+        it; otherwise it would just repeat the max.
+        """
+        return [
+            (pct, self.percentile(pct))
+            for pct in REPORT_PERCENTILES
+            if round(self.count * (100 - pct), 6) >= 100
+        ]
+
+
+@dataclass(slots=True)
+class Stats:
+    """Counters collected during a load test run."""
+
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    error_counts: Counter[str] = field(default_factory=Counter)
+    latencies: LatencyHistogram = field(default_factory=LatencyHistogram)
+    start_time: float = field(default_factory=time.time)
+    active_requests: int = 0
+    max_concurrent: int = 0
+    # Cached hedging delay and the sample count it was computed at
+    hedge_delay: float = 0.0
+    hedge_delay_samples: int = 0
+
+
+# Samples needed before the running p95 is trusted as a hedging delay
+HEDGE_MIN_SAMPLES = 20
+# New samples after which the cached hedging delay is recomputed
+HEDGE_REFRESH_SAMPLES = 100
+
+
+def hedge_delay(stats: Stats) -> float | None:
+    """Running p95 latency to hedge after, or None until there are enough samples.
+
+    The percentile walks every histogram bucket, so it is cached and only
+    refreshed every HEDGE_REFRESH_SAMPLES samples rather than per request.
+    """
+    samples = len(stats.latencies)
+    if samples < HEDGE_MIN_SAMPLES:
+        return None
+    if (
+        not stats.hedge_delay_samples
+        or samples - stats.hedge_delay_samples >= HEDGE_REFRESH_SAMPLES
+    ):
+        stats.hedge_delay = stats.latencies.percentile(95)
+        stats.hedge_delay_samples = samples
+    return stats.hedge_delay
+
+
+async def tracked_search(query: str, stats: Stats) -> list:
+    """Issue one search request, tracking the peak number in flight."""
+    stats.active_requests += 1
+    if stats.active_requests > stats.max_concurrent:
+        stats.max_concurrent = stats.active_requests
+    try:
+        return await async_search_publications(query)
+    finally:
+        stats.active_requests -= 1
+
+
+async def hedged_search(query: str, stats: Stats) -> list:
+    """Search, issuing a duplicate request if the first outlives the running p95.
+
+    Whichever attempt succeeds first wins and the other is cancelled, which
+    cuts tail latency at the cost of a few extra requests. Duplicates are
+    added to stats.total_requests so reported load includes them, unless the
+    whole call is cancelled.
+    """
+    first = asyncio.create_task(tracked_search(query, stats))
+    attempts = {first}
+    try:
+        delay = hedge_delay(stats)
+        if delay is not None:
+            await asyncio.wait(attempts, timeout=delay)
+            if not first.done():
+                stats.total_requests += REQUESTS_PER_CALL
+                attempts.add(asyncio.create_task(tracked_search(query, stats)))
+        pending = attempts
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Retrieve every exception first, so a failure finishing alongside
+            # the winner is not reported as never retrieved
+            errors = {task: task.exception() for task in done}
+            for task, exc in errors.items():
+                if exc is None:
+                    return task.result()
+                error = exc
+        raise error
+    except asyncio.CancelledError:
+        if len(attempts) > 1:
+            stats.total_requests -= REQUESTS_PER_CALL
+        raise
+    finally:
+        for task in attempts:
+            task.cancel()
+        await asyncio.gather(*attempts, return_exceptions=True)
+
+
+def configure_logging(verbose: bool = False) -> QueueListener:
+    """Log through a queue so tasks never block on console writes.
+
+    Records are handed to a QueueListener thread that owns the stream handler.
+    The root logger stays at WARNING so httpx/httpcore/mcp do not log every
+    request; only this harness and cashmere_client log at INFO, or DEBUG
+    (per-request messages) when verbose is set.
+
+    Returns:
+        The started listener; stop it to flush remaining records
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    level = logging.DEBUG if verbose else logging.INFO
+    logger.setLevel(level)
+    logging.getLogger("cashmere_client").setLevel(level)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
 
-# 3 handshakes, 1 tool/resource call, 1 cleanup
-REQUESTS_PER_CALL = 5
+
+def backoff_delay(retry: int) -> float:
+    """Delay before the given (1-based) retry, with full jitter.
+
+    Randomizing within the exponential cap keeps retries of requests that
+    failed together from hitting the server in lockstep.
+    """
+    return BACKOFFS[min(retry, len(BACKOFFS)) - 1] * random.random()
+
+
+@contextmanager
+def uncapped_client_calls():
+    """Lift the client's optional in-flight call cap for the enclosed block.
+
+    The harness sets concurrency itself; calls queued behind a client-side
+    cap would be measured as server latency. The previous cap is restored
+    on exit.
+    """
+    previous = settings.CASHMERE_MAX_CONCURRENT_CALLS
+    settings.CASHMERE_MAX_CONCURRENT_CALLS = 0
+    try:
+        yield
+    finally:
+        settings.CASHMERE_MAX_CONCURRENT_CALLS = previous
+
+
+@contextmanager
+def profiling(path: str | None):
+    """Profile the enclosed block with cProfile when a path is given.
+
+    The raw stats are dumped to path (for snakeviz, gprof2dot, etc.) and the
+    top functions by cumulative time are printed, which shows whether time
+    goes to the harness itself or to waiting on the server.
+    """
+    if not path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"\nProfile written to {path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+
+@lru_cache(maxsize=1)
+def load_query_pool() -> tuple[str, ...]:
+    """Load the sample search queries once, falling back to generated ones."""
+    try:
+        with open("sample_search_queries.json", "rb") as f:
+            return tuple(json.load(f)["search_queries"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+        print(f"Warning: Could not load sample queries: {e}. Using fallback queries.")
+        return tuple(f"query {i}" for i in range(100))
 
 
 async def test_requests_per_second(
-    duration_seconds: int = 10, max_retries: int = 3, max_concurrent: int = 3
+    duration_seconds: int = 10,
+    max_retries: int = 3,
+    max_concurrent: int = 3,
+    hedge: bool = False,
 ):
     """Test the requests per second that the search_publications tool can handle.
 
@@ -20,166 +291,135 @@ async def test_requests_per_second(
         duration_seconds: How long to run the test for (default: 10 seconds)
         max_retries: Maximum number of retry attempts for failed requests (default: 3)
         max_concurrent: Maximum number of concurrent requests (default: 50)
+        hedge: Hedge slow requests with a second attempt (default: False)
 
     Returns:
-        dict: Statistics about the test run
+        Stats: Statistics about the test run
     """
-    stats = {
-        "total_requests": 0,
-        "successful_requests": 0,
-        "failed_requests": 0,
-        "error_counts": {},
-        "latencies": [],
-        "start_time": time.time(),
-        "active_requests": 0,
-        "max_concurrent": 0,
-    }
+    stats = Stats()
 
     # Semaphore to limit concurrency
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    try:
-        with open("sample_search_queries.json") as f:
-            query_pool = json.load(f)["search_queries"]
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-        print(f"Warning: Could not load sample queries: {e}. Using fallback queries.")
-        query_pool = [f"query {i}" for i in range(100)]
+    query_pool = load_query_pool()
+    queries = itertools.cycle(random.sample(query_pool, len(query_pool)))
 
     async def make_request():
-        nonlocal stats
-        query = random.choice(query_pool)
+        query = next(queries)
         retries = 0
         last_error = None
 
-        try:
-            async with semaphore:
-                stats["active_requests"] += 1
-                stats["max_concurrent"] = max(
-                    stats["max_concurrent"], stats["active_requests"]
-                )
-
-                while retries <= max_retries:
-                    try:
-                        request_start = time.time()
-                        res = await async_search_publications(query)
-                        print(
-                            f"[search_publications] Query: {query} Publications: {len(res) if res else 0}"
-                        )
-                        latency = (time.time() - request_start) / REQUESTS_PER_CALL
-                        stats["latencies"].append(latency)
-                        stats["successful_requests"] += 1
-                        return
-                    except Exception as e:
-                        last_error = e
-                        retries += 1
-                        if retries <= max_retries:
-                            # Exponential backoff: 100ms, 200ms, 400ms, etc.
-                            await asyncio.sleep(0.1 * (2 ** (retries - 1)))
-                        continue
-
-                # If we get here, all retries failed
-                stats["failed_requests"] += 1
-                error_name = type(last_error).__name__
-                stats["error_counts"][error_name] = (
-                    stats["error_counts"].get(error_name, 0) + 1
+        while retries <= max_retries:
+            try:
+                request_start = _perf()
+                if hedge:
+                    res = await hedged_search(query, stats)
+                else:
+                    res = await tracked_search(query, stats)
+                logger.debug(
+                    "[search_publications] Query: %s Publications: %d",
+                    query,
+                    len(res) if res else 0,
                 )
-                return last_error
+                latency = (_perf() - request_start) / REQUESTS_PER_CALL
+                stats.latencies.record(latency)
+                stats.successful_requests += 1
+                return
+            except Exception as e:
+                last_error = e
+                retries += 1
+                if retries <= max_retries:
+                    await asyncio.sleep(backoff_delay(retries))
+                continue
+
+        # If we get here, all retries failed
+        stats.failed_requests += 1
+        error_name = type(last_error).__name__
+        stats.error_counts[error_name] += 1
+        return last_error
+
+    async def bounded():
+        stats.total_requests += REQUESTS_PER_CALL
+        try:
+            return await make_request()
+        except asyncio.CancelledError:
+            # Calls still in flight at the deadline are abandoned and do not
+            # count as requests (hedged_search takes back its own duplicate)
+            stats.total_requests -= REQUESTS_PER_CALL
+            raise
         finally:
-            stats["active_requests"] = max(0, stats["active_requests"] - 1)
+            semaphore.release()
 
     # Run the test for the specified duration
     print(
         f"Starting test for {duration_seconds} seconds with max {max_concurrent} concurrent requests..."
     )
     start_time = time.time()
-    end_time = start_time + duration_seconds
-
-    tasks = set()
-    try:
-        while time.time() < end_time:
-            # Clean up completed tasks
-            done_tasks = {t for t in tasks if t.done()}
-            tasks -= done_tasks
-
-            # Check if we can add more tasks
-            if len(tasks) < max_concurrent * 2:  # Keep some buffer
-                stats["total_requests"] += REQUESTS_PER_CALL
-                task = asyncio.create_task(make_request())
-                tasks.add(task)
-                task.add_done_callback(tasks.discard)
-
-            # Small sleep to prevent busy waiting
-            await asyncio.sleep(0.001)
-
-        # Wait for remaining tasks to complete with a timeout and process results
-        if tasks:
-            done, _ = await asyncio.wait(tasks, timeout=0.1)
-            # Process any remaining errors from completed tasks
-            for task in done:
-                if task.done() and not task.cancelled():
-                    try:
-                        await task
-                    except Exception:
-                        # These errors were already counted in make_request
-                        pass
 
-    except asyncio.CancelledError:
-        # Clean up any remaining tasks
-        for task in tasks:
-            if not task.done():
+    # One MCP session is shared by every call and closed when the test ends
+    async with session():
+        tasks = set()
+        try:
+            # The semaphore alone bounds concurrency: a call is only started once
+            # a slot is free, and finished calls release their slot
+            async with asyncio.timeout(duration_seconds):
+                while True:
+                    await semaphore.acquire()
+                    task = asyncio.create_task(bounded())
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except TimeoutError:
+            # Give calls still in flight a moment to finish
+            if tasks:
+                await asyncio.wait(tasks, timeout=0.1)
+        finally:
+            # Abandon the rest, and wait for them to unwind before the
+            # session closes under them
+            for task in tasks:
                 task.cancel()
-        if tasks:
-            await asyncio.wait(tasks, timeout=0.1)
-        raise
+            if tasks:
+                await asyncio.wait(tasks)
 
     # Print summary
     elapsed = time.time() - start_time
-    rps = stats["total_requests"] / elapsed if elapsed > 0 else 0
+    rps = stats.total_requests / elapsed if elapsed > 0 else 0
 
     print(f"\nTest completed in {elapsed:.2f} seconds")
-    print(f"Total requests: {stats['total_requests']}")
-    print(f"Successful client calls: {stats['successful_requests']}")
-    print(f"Failed client calls: {stats['failed_requests']}")
-    print(f"Max concurrent client calls: {stats['max_concurrent']}")
+    print(f"Total requests: {stats.total_requests}")
+    print(f"Successful client calls: {stats.successful_requests}")
+    print(f"Failed client calls: {stats.failed_requests}")
+    print(f"Max concurrent requests: {stats.max_concurrent}")
     print(
-        f"Success rate: {(stats['successful_requests'] / (stats['successful_requests'] + stats['failed_requests']) * 100):.2f}%"
-        if stats["total_requests"] > 0
+        f"Success rate: {(stats.successful_requests / (stats.successful_requests + stats.failed_requests) * 100):.2f}%"
+        if stats.total_requests > 0
         else "No requests made"
     )
     print(f"Requests per second: {rps:.2f}")
 
-    if stats["latencies"]:
+    if stats.latencies:
         print("\nLatency (ms):")
-        print(f"  Min: {min(stats['latencies']) * 1000:.2f}")
-        print(
-            f"  Avg: {(sum(stats['latencies']) / len(stats['latencies'])) * 1000:.2f}"
-        )
-        print(f"  Max: {max(stats['latencies']) * 1000:.2f}")
-
-        # Calculate percentiles if we have enough data
-        if len(stats["latencies"]) >= 10:
-            sorted_latencies = sorted(stats["latencies"])
-            p50 = sorted_latencies[int(len(sorted_latencies) * 0.5)]
-            p95 = sorted_latencies[int(len(sorted_latencies) * 0.95)]
-            p99 = sorted_latencies[int(len(sorted_latencies) * 0.99)]
-            print(f"  p50: {p50 * 1000:.2f}ms")
-            print(f"  p95: {p95 * 1000:.2f}ms")
-            print(f"  p99: {p99 * 1000:.2f}ms")
-
-    if stats["error_counts"]:
+        print(f"  Min: {stats.latencies.min * 1000:.2f}")
+        print(f"  Avg: {stats.latencies.mean() * 1000:.2f}")
+        print(f"  Max: {stats.latencies.max * 1000:.2f}")
+
+        for pct, latency in stats.latencies.distribution():
+            print(f"  p{pct:g}: {latency * 1000:.2f}ms")
+
+    if stats.error_counts:
         print("\nErrors encountered:")
-        for error, count in sorted(
-            stats["error_counts"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for error, count in stats.error_counts.most_common():
             print(
-                f"  {error}: {count} ({(count / stats['total_requests'] * 100):.1f}%)"
+                f"  {error}: {count} ({(count / (stats.successful_requests + stats.failed_requests) * 100):.1f}%)"
             )
 
     return stats
 
 
 async def load_test(
-    num_calls: int = 2000, concurrency: int | None = None, max_retries: int = 3
+    num_calls: int = 2000,
+    concurrency: int | None = None,
+    max_retries: int = 3,
+    hedge: bool = False,
 ) -> None:
     """
     Run a load test with the specified number of requests and concurrency.
@@ -188,170 +428,103 @@ async def load_test(
         num_calls: Total number of client calls to make (default: 2000)
         concurrency: Maximum number of concurrent requests (default: min(100, num_requests))
         max_retries: Maximum number of retry attempts for failed requests (default: 3)
+        hedge: Hedge slow requests with a second attempt (default: False)
     """
     concurrency = min(concurrency or num_calls, 100)  # Cap concurrency at 100
 
-    stats = {
-        "total_requests": 0,
-        "successful_requests": 0,
-        "failed_requests": 0,
-        "error_counts": {},
-        "latencies": [],
-        "start_time": time.time(),
-        "active_requests": 0,
-        "max_concurrent": 0,
-    }
-
-    # Semaphore to limit concurrency
-    semaphore = asyncio.Semaphore(concurrency)
+    stats = Stats()
 
-    try:
-        with open("sample_search_queries.json") as f:
-            query_pool = json.load(f)["search_queries"]
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-        print(f"Warning: Could not load sample queries: {e}. Using fallback queries.")
-        query_pool = [f"query {i}" for i in range(100)]
+    query_pool = load_query_pool()
+    queries = itertools.cycle(random.sample(query_pool, len(query_pool)))
 
     async def make_request():
-        nonlocal stats
-        query = random.choice(query_pool)
-        retries = 0
+        query = next(queries)
         last_error = None
 
-        try:
-            async with semaphore:
-                stats["active_requests"] += 1
-                stats["max_concurrent"] = max(
-                    stats["max_concurrent"], stats["active_requests"]
-                )
-
-                while retries <= max_retries:
-                    print(f"[search initial] Query: {query}")
-                    if retries > 0:
-                        print(f"[retrying] Query: {query}, retry: {retries}")
-                    try:
-                        request_start = time.time()
-                        res = await async_search_publications(query)
-                        latency = (time.time() - request_start) / REQUESTS_PER_CALL
-                        stats["latencies"].append(latency)
-                        print(
-                            f"[search_publications] Query: {query} Publications: {len(res) if res else 0} Latency: {latency * 1000:.2f}ms"
-                        )
-                        stats["successful_requests"] += 1
-                        return
-                    except Exception as e:
-                        print(f"Exception: {e}")
-                        raise
-                        last_error = e
-                        retries += 1
-                        if retries <= max_retries:
-                            # Exponential backoff: 100ms, 200ms, 400ms, etc.
-                            await asyncio.sleep(0.1 * (2 ** (retries - 1)))
-                        continue
-
-                # If we get here, all retries failed
-                stats["failed_requests"] += 1
-                error_name = type(last_error).__name__
-                stats["error_counts"][error_name] = (
-                    stats["error_counts"].get(error_name, 0) + 1
+        for retries in range(max_retries + 1):
+            logger.debug("[search initial] Query: %s", query)
+            if retries > 0:
+                logger.debug("[retrying] Query: %s, retry: %d", query, retries)
+                await asyncio.sleep(backoff_delay(retries))
+            try:
+                request_start = _perf()
+                if hedge:
+                    res = await hedged_search(query, stats)
+                else:
+                    res = await tracked_search(query, stats)
+                latency = (_perf() - request_start) / REQUESTS_PER_CALL
+                stats.latencies.record(latency)
+                logger.debug(
+                    "[search_publications] Query: %s Publications: %d Latency: %.2fms",
+                    query,
+                    len(res) if res else 0,
+                    latency * 1000,
                 )
-                return last_error
-        finally:
-            stats["active_requests"] = max(0, stats["active_requests"] - 1)
-
-    # Create and manage tasks with controlled concurrency
-    tasks = set()
-    stats["start_time"] = time.time()
-
-    try:
-        # Start initial batch of tasks
-        for _ in range(min(concurrency * 2, num_calls)):
-            if stats["total_requests"] >= num_calls * REQUESTS_PER_CALL:
-                break
-            stats["total_requests"] += REQUESTS_PER_CALL
-            task = asyncio.create_task(make_request())
-            tasks.add(task)
-            task.add_done_callback(tasks.discard)
-
-        # Process remaining tasks as others complete
-        while stats["total_requests"] < num_calls * REQUESTS_PER_CALL and tasks:
-            # Wait for at least one task to complete
-            done, pending = await asyncio.wait(
-                tasks, return_when=asyncio.FIRST_COMPLETED
-            )
-
-            # Start new tasks to replace completed ones
-            for _ in range(len(done)):
-                if stats["total_requests"] < num_calls * REQUESTS_PER_CALL:
-                    stats["total_requests"] += REQUESTS_PER_CALL
-                    task = asyncio.create_task(make_request())
-                    tasks.add(task)
-                    task.add_done_callback(tasks.discard)
-
-        # Wait for all remaining tasks to complete and process results
-        if tasks:
-            done, _ = await asyncio.wait(tasks, timeout=30.0)
-            # Process any remaining errors from completed tasks
-            for task in done:
-                if task.done() and not task.cancelled():
-                    try:
-                        await task
-                    except Exception:
-                        # These errors were already counted in make_request
-                        pass
-
-    except asyncio.CancelledError:
-        # Clean up any remaining tasks
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-        if tasks:
-            await asyncio.wait(tasks, timeout=5.0)
-        raise
-
-    total_time = time.time() - stats["start_time"]
+                stats.successful_requests += 1
+                return
+            except Exception as e:
+                logger.warning("Exception: %s", e)
+                last_error = e
+
+        # If we get here, all retries failed
+        stats.failed_requests += 1
+        error_name = type(last_error).__name__
+        stats.error_counts[error_name] += 1
+        return last_error
+
+    # A fixed pool of workers takes calls from a shared iterator, so the
+    # number of workers bounds concurrency without per-call tasks
+    calls = iter(range(num_calls))
+    workers = min(concurrency, num_calls)
+
+    async def worker():
+        for _ in calls:
+            stats.total_requests += REQUESTS_PER_CALL
+            await make_request()
+
+    stats.start_time = time.time()
+    # One MCP session is shared by every call and closed when the test ends
+    async with session(), asyncio.TaskGroup() as tg:
+        for _ in range(workers):
+            tg.create_task(worker())
+
+    total_time = time.time() - stats.start_time
 
     # Print results
+    # Hedged duplicates count as requests but not as client calls
+    finished = stats.successful_requests + stats.failed_requests
     print(f"\n[load_test] Results (completed in {total_time:.2f} seconds):")
-    print(f"  Total requests: {stats['total_requests']}")
-    print(
-        f"  Successful client calls: {stats['successful_requests']} ({(stats['successful_requests'] / stats['total_requests'] * REQUESTS_PER_CALL * 100):.1f}%)"
-    )
-    print(
-        f"  Failed client calls: {stats['failed_requests']} ({(stats['failed_requests'] / stats['total_requests'] * REQUESTS_PER_CALL * 100):.1f}%)"
-    )
-    print(f"  Max concurrent client calls: {stats['max_concurrent']}")
+    print(f"  Total requests: {stats.total_requests}")
+    if finished:
+        print(
+            f"  Successful client calls: {stats.successful_requests} ({(stats.successful_requests / finished * 100):.1f}%)"
+        )
+        print(
+            f"  Failed client calls: {stats.failed_requests} ({(stats.failed_requests / finished * 100):.1f}%)"
+        )
+    else:
+        print("  No client calls made")
+    print(f"  Max concurrent requests: {stats.max_concurrent}")
 
-    if stats["error_counts"]:
+    if stats.error_counts:
         print("\n  Error breakdown:")
-        for error, count in sorted(
-            stats["error_counts"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for error, count in stats.error_counts.most_common():
             print(
-                f"    {error}: {count} ({(count / stats['total_requests'] * 100):.1f}%)"
+                f"    {error}: {count} ({(count / finished * 100):.1f}%)"
             )
 
-    if stats["latencies"]:
-        rps = stats['total_requests'] / total_time
-        sorted_latencies = sorted(stats["latencies"])
-        p50 = sorted_latencies[int(len(sorted_latencies) * 0.5)] * 1000
-        p95 = sorted_latencies[int(len(sorted_latencies) * 0.95)] * 1000
-        p99 = (
-            sorted_latencies[int(len(sorted_latencies) * 0.99)] * 1000
-            if len(sorted_latencies) >= 100
-            else 0.0
-        )
+    if stats.latencies:
+        rps = stats.total_requests / total_time
 
         print("\n  Successful request metrics:")
         print(f"    Requests per second: {rps:.2f}")
-        print(f"    Latency (p50): {p50:.2f}ms")
-        print(f"    Latency (p95): {p95:.2f}ms")
-        if p99 > 0:
-            print(f"    Latency (p99): {p99:.2f}ms")
+        for pct, latency in stats.latencies.distribution():
+            print(f"    Latency (p{pct:g}): {latency * 1000:.2f}ms")
+        print(f"    Latency (max): {stats.latencies.max * 1000:.2f}ms")
 
 
-# Entrypoint for command-line usage
-if __name__ == "__main__":
+def build_parser() -> "argparse.ArgumentParser":
+    """Build the command-line parser for the load-testing helper."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -389,22 +562,59 @@ if __name__ == "__main__":
         default=10,
         help="Duration to run in seconds",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every request",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate request when one outlives the running p95 latency",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Profile the run with cProfile and write the stats to PATH",
+    )
+    return parser
 
-    if args.mode == "load":
-        asyncio.run(
-            load_test(
-                num_calls=args.calls,
-                concurrency=args.concurrency,
-            )
-        )
-    elif args.mode == "rps":
-        asyncio.run(
-            test_requests_per_second(
-                duration_seconds=args.duration,
-                max_concurrent=args.concurrency,
-            )
-        )
-    else:
-        parser.print_help()
-        sys.exit(1)
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point.
+
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    log_listener = configure_logging(args.verbose)
+    try:
+        with profiling(args.profile), uncapped_client_calls():
+            if args.mode == "load":
+                run_async(
+                    load_test(
+                        num_calls=args.calls,
+                        concurrency=args.concurrency,
+                        hedge=args.hedge,
+                    )
+                )
+            elif args.mode == "rps":
+                run_async(
+                    test_requests_per_second(
+                        duration_seconds=args.duration,
+                        max_concurrent=args.concurrency,
+                        hedge=args.hedge,
+                    )
+                )
+            else:
+                parser.print_help()
+                sys.exit(1)
+    finally:
+        # Flush queued records even on an exception or Ctrl-C
+        log_listener.stop()
+
+
+# Entrypoint for command-line usage
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
+import asyncio
+import atexit
+from functools import lru_cache
+import inspect
 import json
 import logging
 import random
+import sys
 import traceback
 
 import cashmere_client
@@ -27,12 +32,20 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
+@lru_cache(maxsize=1)
+def get_slack_client() -> httpx.Client:
+    """Client reused for every alert, so a burst of failures shares one connection."""
+    client = httpx.Client()
+    atexit.register(client.close)
+    return client
+
+
 def send_slack_message(message: str):
     if not settings.SLACK_WEBHOOK_URL:
         logging.info("Not alerting via slack")
         return
     try:
-        response = httpx.post(
+        response = get_slack_client().post(
             settings.SLACK_WEBHOOK_URL,
             headers={"Content-Type": "application/json"},
             json={
@@ -48,20 +61,31 @@ def send_slack_message(message: str):
         logging.error(f"Failed to send Slack message: {e}")
 
 
-def get_query():
+@lru_cache(maxsize=1)
+def load_query_pool() -> tuple[str, ...]:
+    """Load the sample search queries once; the file does not change at runtime."""
     try:
         with open("sample_search_queries.json") as f:
-            query_pool = json.load(f)["search_queries"]
+            return tuple(json.load(f)["search_queries"])
     except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
         logging.warning(f"Warning: Could not load sample queries: {e}. Using fallback.")
-        query_pool = [f"What's the good word on footbal games?"]
-    return random.choice(query_pool)
+        return (f"What's the good word on footbal games?",)
+
+
+def get_query():
+    return random.choice(load_query_pool())
+
+
+class CheckFailed(Exception):
+    """A validation check failed; the message names the call and carries its traceback."""
 
 
-def test_call(func, *args, extra_result_test = None, **kwargs):
+async def test_call(func, *args, extra_result_test = None, **kwargs):
     try:
         logging.info(f"{func.__name__} {args} {kwargs}")
         result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
         logging.info(f"{func.__name__} succeeded")
         if extra_result_test:
             extra_result_test(result)
@@ -70,8 +94,7 @@ def test_call(func, *args, extra_result_test = None, **kwargs):
         tb = traceback.format_exc()
         msg = f"Function {func.__name__} {args} {kwargs} failed with error: {e}\nTraceback:\n{tb}"
         logging.error(msg)
-        send_slack_message(msg)
-        exit(1)
+        raise CheckFailed(msg) from e
 
 
 def expectations_from_tool_config(
@@ -146,54 +169,93 @@ def test_hidden_tool_params(tools: list[dict], expected_hidden: dict[str, list[s
                 )
 
 
-def main():
-    test_call(cashmere_client.list_tools, extra_result_test=test_dynamic_descriptions)
-    if settings.TOOL_CONFIG_API_KEY:
-        cfg_raw = (settings.TOOL_CONFIG or "").strip()
-        if not cfg_raw or cfg_raw == "{}":
-            logging.info(
-                "TOOL_CONFIG_API_KEY set but TOOL_CONFIG empty; skipping tool_config list_tools checks"
-            )
-        else:
-            expected_disabled, expected_hidden_params = test_call(
-                parse_tool_config_expectations,
-                cfg_raw,
-            )
-            if not expected_disabled and not expected_hidden_params:
-                logging.info(
-                    "TOOL_CONFIG has no disabled tools or hidden_params; skipping list_tools_with_key"
-                )
-            else:
-                tool_config_tools = test_call(
-                    cashmere_client.list_tools_with_key,
-                    settings.TOOL_CONFIG_API_KEY,
-                )
-                if expected_disabled:
-                    test_call(
-                        test_hidden_tools,
-                        tool_config_tools,
-                        expected_disabled,
-                    )
-                if expected_hidden_params:
-                    test_call(
-                        test_hidden_tool_params,
-                        tool_config_tools,
-                        expected_hidden_params,
-                    )
-    else:
+async def check_tool_config():
+    if not settings.TOOL_CONFIG_API_KEY:
         logging.info(
             "TOOL_CONFIG_API_KEY not set; skipping tool_config checks "
             "(set it with TOOL_CONFIG to validate CustomApp.tool_config for a second app)"
         )
-    test_call(cashmere_client.list_resources)
-    test_call(cashmere_client.search_publications, query=get_query())
-    collections_res = test_call(cashmere_client.list_collections, limit=10, offset=0)
-    collection_ids = [item['id'] for item in collections_res['items']] # type: ignore
-    test_call(cashmere_client.get_collection, random.choice(collection_ids))
-    publications_res = test_call(cashmere_client.list_publications, limit=10, offset=0)
-    publication_uuids = [item['uuid'] for item in publications_res['items']] # type: ignore
-    test_call(cashmere_client.get_publication, random.choice(publication_uuids))
-    test_call(cashmere_client.get_usage_report_summary)
+        return
+    cfg_raw = (settings.TOOL_CONFIG or "").strip()
+    if not cfg_raw or cfg_raw == "{}":
+        logging.info(
+            "TOOL_CONFIG_API_KEY set but TOOL_CONFIG empty; skipping tool_config list_tools checks"
+        )
+        return
+    expected_disabled, expected_hidden_params = await test_call(
+        parse_tool_config_expectations,
+        cfg_raw,
+    )
+    if not expected_disabled and not expected_hidden_params:
+        logging.info(
+            "TOOL_CONFIG has no disabled tools or hidden_params; skipping list_tools_with_key"
+        )
+        return
+    tool_config_tools = await test_call(
+        cashmere_client.async_list_tools_with_key,
+        settings.TOOL_CONFIG_API_KEY,
+    )
+    if expected_disabled:
+        await test_call(
+            test_hidden_tools,
+            tool_config_tools,
+            expected_disabled,
+        )
+    if expected_hidden_params:
+        await test_call(
+            test_hidden_tool_params,
+            tool_config_tools,
+            expected_hidden_params,
+        )
+
+
+async def _amain() -> bool:
+    """Run every check, then send one Slack alert covering all failures.
+
+    Returns:
+        Whether all checks passed
+    """
+    # One MCP session is shared by every check and closed when they finish
+    async with cashmere_client.session():
+        # Independent checks run concurrently; only the get-by-id calls
+        # wait for the list results they pick ids from. Failures are collected
+        # rather than raised so one failing check does not cancel the others.
+        results = await asyncio.gather(
+            test_call(
+                cashmere_client.async_list_tools,
+                extra_result_test=test_dynamic_descriptions,
+            ),
+            check_tool_config(),
+            test_call(cashmere_client.async_list_resources),
+            test_call(cashmere_client.async_search_publications, query=get_query()),
+            test_call(cashmere_client.async_list_collections, limit=10, offset=0),
+            test_call(cashmere_client.async_list_publications, limit=10, offset=0),
+            test_call(cashmere_client.async_get_usage_report_summary),
+            return_exceptions=True,
+        )
+        collections_res, publications_res = results[4], results[5]
+        lookups = []
+        if not isinstance(collections_res, BaseException):
+            collection_id = random.choice(collections_res['items'])['id'] # type: ignore
+            lookups.append(test_call(cashmere_client.async_get_collection, collection_id))
+        if not isinstance(publications_res, BaseException):
+            publication_uuid = random.choice(publications_res['items'])['uuid'] # type: ignore
+            lookups.append(test_call(cashmere_client.async_get_publication, publication_uuid))
+        results += await asyncio.gather(*lookups, return_exceptions=True)
+    failures = [str(result) for result in results if isinstance(result, BaseException)]
+    if failures:
+        # The webhook client is synchronous, so post from a worker thread
+        await asyncio.to_thread(
+            send_slack_message,
+            f"{len(failures)} of {len(results)} checks failed:\n\n" + "\n\n".join(failures),
+        )
+    return not failures
+
+
+def main():
+    # Exit only once every check has finished and the session is closed
+    if not cashmere_client.run_async(_amain()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":